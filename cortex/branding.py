@@ -11,12 +11,24 @@ Enhanced with rich output formatting (Issue #242):
 - Consistent visual language
 """
 
+from collections.abc import Generator
+from contextlib import contextmanager
+from functools import lru_cache
+from typing import TypeVar
+
 from rich import box
 from rich.console import Console
 from rich.panel import Panel
 from rich.table import Table
+from rich.text import Text
+
+# Configured once for every Cortex print: output is already styled with
+# markup, so Rich's automatic repr highlighting and log decorations are off.
+console = Console(highlight=False, log_path=False, log_time=False)
 
-console = Console()
+# Lines waiting to be printed in one go (see cx_batch/cx_flush)
+_line_buffer: list[str | Text] = []
+_batch_depth = 0
 
 # Brand colors
 CORTEX_CYAN = "cyan"
@@ -44,6 +56,125 @@ LOGO_SMALL = """[bold cyan]╔═╗─┐ ┬[/bold cyan]
 # Version info
 VERSION = "0.1.0"
 
+# Status icons for consistent visual language
+STATUS_ICONS = {
+    "success": "✓",
+    "error": "✗",
+    "warning": "⚠",
+    "info": "ℹ",
+    "pending": "○",
+    "running": "●",
+    "skipped": "◌",
+    "active": "▶",
+    "installed": "📦",
+    "removed": "🗑️",
+    "updated": "🔄",
+}
+
+# Icons wrapped in their display color, built once. The source for the CX
+# prefixes, the ICON_* Text objects and output_formatter's step statuses.
+STYLED_ICONS = {
+    name: f"[{color}]{STATUS_ICONS[name]}[/{color}]"
+    for name, color in {
+        "success": CORTEX_SUCCESS,
+        "error": CORTEX_ERROR,
+        "warning": CORTEX_WARNING,
+        "info": CORTEX_INFO,
+        "pending": CORTEX_MUTED,
+        "running": CORTEX_CYAN,
+        "skipped": CORTEX_MUTED,
+    }.items()
+}
+
+# CX badge and per-status prefixes, built once at import
+_BADGE = "[bold white on dark_cyan] CX [/bold white on dark_cyan]"
+_STATUS_ICONS = {
+    "info": "[dim]│[/dim]",
+    "success": STYLED_ICONS["success"],
+    "warning": STYLED_ICONS["warning"],
+    "error": STYLED_ICONS["error"],
+    "thinking": "[cyan]⠋[/cyan]",  # Spinner frame
+}
+_PREFIX = {status: f"{_BADGE} {icon} " for status, icon in _STATUS_ICONS.items()}
+_STEP_PREFIX = f"{_BADGE} [dim]│[/dim] "
+
+# Pre-parsed icons for the cx_* and output_formatter print_* message helpers
+ICON_SUCCESS = Text.from_markup(f"{STYLED_ICONS['success']} ")
+ICON_ERROR = Text.from_markup(f"{STYLED_ICONS['error']} ")
+ICON_WARNING = Text.from_markup(f"{STYLED_ICONS['warning']} ")
+ICON_INFO = Text.from_markup(f"{STYLED_ICONS['info']} ")
+_ICON_SPINNER = Text.from_markup(f"[{CORTEX_CYAN}]⠋[/{CORTEX_CYAN}] ")
+
+
+def _emit(line: str | Text = "", write: bool = True) -> None:
+    """
+    Print a single line (markup string or Text), or buffer it while batching.
+
+    Lines are buffered when write is False or when inside cx_batch(),
+    and printed later by cx_flush().
+    """
+    if write and not _batch_depth:
+        if _line_buffer:
+            cx_flush()  # keep earlier write=False lines ahead of this one
+        console.print(line)
+    else:
+        _line_buffer.append(line)
+
+
+def cx_flush() -> None:
+    """
+    Print all buffered lines with a single console call.
+    """
+    if _line_buffer:
+        console.print(*_line_buffer, sep="\n")
+        _line_buffer.clear()
+
+
+@contextmanager
+def cx_batch() -> Generator[None, None, None]:
+    """
+    Collect cx_* output and flush it once when the block exits.
+
+    The buffer and batch depth are module-level (shared by all threads), so
+    while a batch is open cx_* output from every thread is held until it
+    exits. Only batch from the thread that owns the console output.
+
+    Example:
+        with cx_batch():
+            for i, step in enumerate(steps, 1):
+                cx_step(i, len(steps), step)
+    """
+    global _batch_depth
+    _batch_depth += 1
+    try:
+        yield
+    finally:
+        _batch_depth -= 1
+        if not _batch_depth:
+            cx_flush()
+
+
+@contextmanager
+def single_write() -> Generator[None, None, None]:
+    """
+    Render everything printed in the block and write it to the terminal
+    with one write/flush instead of one per print.
+
+    The line buffer is flushed into the capture before it closes, so the
+    block's output is written even inside an outer cx_batch() (along with
+    any lines that batch had already buffered).
+    """
+    capture = console.capture()
+    try:
+        with capture, cx_batch():
+            try:
+                yield
+            finally:
+                cx_flush()
+    finally:
+        console.file.write(capture.get())
+        console.file.flush()
+
 
 def show_banner(show_version: bool = True):
     """
@@ -56,10 +187,11 @@ def show_banner(show_version: bool = True):
     if show_version:
         content += f"\n[dim]v{VERSION}[/dim]"
 
+    cx_flush()
     console.print(Panel(content, border_style="cyan", padding=(0, 2)))
 
 
-def cx_print(message: str, status: str = "info"):
+def cx_print(message: str, status: str = "info", write: bool = True):
     """
     Print a message with the CX badge prefix.
     Like Claude's orange icon, but for Cortex.
@@ -67,38 +199,34 @@ def cx_print(message: str, status: str = "info"):
     Args:
         message: The message to display
         status: One of "info", "success", "warning", "error", "thinking"
+        write: Print immediately (False buffers the line until cx_flush)
     """
-    badge = "[bold white on dark_cyan] CX [/bold white on dark_cyan]"
-
-    status_icons = {
-        "info": "[dim]│[/dim]",
-        "success": "[green]✓[/green]",
-        "warning": "[yellow]⚠[/yellow]",
-        "error": "[red]✗[/red]",
-        "thinking": "[cyan]⠋[/cyan]",  # Spinner frame
-    }
-
-    icon = status_icons.get(status, status_icons["info"])
-    console.print(f"{badge} {icon} {message}")
+    _emit(_PREFIX.get(status, _PREFIX["info"]) + message, write)
 
 
-def cx_step(step_num: int, total: int, message: str):
+def cx_step(step_num: int, total: int, message: str, write: bool = True):
     """
     Print a numbered step with the CX badge.
 
     Example: CX │ [1/4] Updating package lists...
     """
-    badge = "[bold white on dark_cyan] CX [/bold white on dark_cyan]"
-    console.print(f"{badge} [dim]│[/dim] [{step_num}/{total}] {message}")
+    _emit(f"{_STEP_PREFIX}[{step_num}/{total}] {message}", write)
 
 
-def cx_header(title: str):
+@lru_cache(maxsize=64)
+def titled_band(title: str, color: str = CORTEX_CYAN) -> str:
+    """
+    Returns the markup for a titled section band (━━━ title ━━━),
+    surrounded by blank lines. Shared by headers and titled dividers.
+    """
+    return f"\n[bold {color}]━━━ {title} ━━━[/bold {color}]\n"
+
+
+def cx_header(title: str, write: bool = True):
     """
     Print a section header.
     """
-    console.print()
-    console.print(f"[bold cyan]━━━ {title} ━━━[/bold cyan]")
-    console.print()
+    _emit(titled_band(title), write)
 
 
 def cx_table_header():
@@ -116,26 +244,62 @@ def show_welcome():
     """
     First-run welcome message.
     """
-    show_banner()
-    console.print()
-    cx_print("Welcome to Cortex! Let's get you set up.", "success")
-    cx_print("Run [bold]cortex wizard[/bold] to configure your API key.", "info")
-    console.print()
+    with single_write():
+        show_banner()
+        _emit()
+        cx_print("Welcome to Cortex! Let's get you set up.", "success")
+        cx_print("Run [bold]cortex wizard[/bold] to configure your API key.", "info")
+        _emit()
 
 
 def show_goodbye():
     """
     Exit message.
     """
-    console.print()
-    cx_print("Done! Run [bold]cortex --help[/bold] for more commands.", "info")
-    console.print()
+    with single_write():
+        _emit()
+        cx_print("Done! Run [bold]cortex --help[/bold] for more commands.", "info")
+        _emit()
 
 
 # ============================================
 # Rich Output Formatting (Issue #242)
 # ============================================
 
+_K = TypeVar("_K")
+
+
+def status_row_templates(colors: dict[_K, str]) -> dict[_K, str]:
+    """
+    Returns status box row templates (formatted with label, value), one per
+    key of colors. Shared by cx_status_box and output_formatter.
+    """
+    return {key: f"  [dim]{{}}:[/dim]  [{color}]{{}}[/{color}]" for key, color in colors.items()}
+
+
+# Row templates for cx_status_box, keyed by status
+_STATUS_ROWS = status_row_templates(
+    {
+        "success": CORTEX_SUCCESS,
+        "warning": CORTEX_WARNING,
+        "error": CORTEX_ERROR,
+        "info": CORTEX_CYAN,
+        "default": "white",
+    }
+)
+
+
+def plain_box(content: str, title: str | None = None, subtitle: str | None = None) -> str:
+    """
+    Returns box content as plain lines for non-terminal output (pipes, CI
+    logs), where box-drawing borders only add noise. Shared by the branding
+    and output_formatter box helpers.
+    """
+    lines = [f"=== {title} ===", content] if title else [content]
+    if subtitle:
+        lines.append(f"--- {subtitle} ---")
+    return "\n".join(lines)
+
 
 def cx_box(
     content: str,
@@ -152,6 +316,10 @@ def cx_box(
         subtitle: Optional box subtitle
         status: Style - "info", "success", "warning", "error"
     """
+    if not console.is_terminal:
+        _emit(plain_box(content, title, subtitle))
+        return
+
     border_colors = {
         "info": CORTEX_CYAN,
         "success": CORTEX_SUCCESS,
@@ -168,6 +336,7 @@ def cx_box(
         padding=(1, 2),
         box=box.ROUNDED,
     )
+    cx_flush()
     console.print(panel)
 
 
@@ -191,23 +360,18 @@ def cx_status_box(
         items: List of (label, value, status) tuples
                status: "success", "warning", "error", "info", "default"
     """
-    style_colors = {
-        "success": CORTEX_SUCCESS,
-        "warning": CORTEX_WARNING,
-        "error": CORTEX_ERROR,
-        "info": CORTEX_CYAN,
-        "default": "white",
-    }
-
     max_label_len = max(len(item[0]) for item in items) if items else 0
-    lines = []
-
-    for label, value, status in items:
-        color = style_colors.get(status, "white")
-        padded_label = label.ljust(max_label_len)
-        lines.append(f"  [dim]{padded_label}:[/dim]  [{color}]{value}[/{color}]")
+    default_row = _STATUS_ROWS["default"]
+    lines = [
+        _STATUS_ROWS.get(status, default_row).format(label.ljust(max_label_len), value)
+        for label, value, status in items
+    ]
 
     content = "\n".join(lines)
+    if not console.is_terminal:
+        _emit(plain_box(content, title))
+        return
+
     panel = Panel(
         content,
         title=f"[bold cyan]{title}[/bold cyan]",
@@ -215,6 +379,7 @@ def cx_status_box(
         padding=(1, 2),
         box=box.ROUNDED,
     )
+    cx_flush()
     console.print(panel)
 
 
@@ -249,9 +414,27 @@ def cx_table(
         style = row_styles[i] if row_styles and i < len(row_styles) else None
         table.add_row(*row, style=style)
 
+    cx_flush()
     console.print(table)
 
 
+# Action keyword -> color for cx_package_table (first match wins)
+_ACTION_COLOR = {
+    "uninstall": CORTEX_ERROR,
+    "install": CORTEX_SUCCESS,
+    "remove": CORTEX_ERROR,
+    "update": CORTEX_WARNING,
+    "upgrade": CORTEX_WARNING,
+}
+
+
+def _style_action(action: str) -> str:
+    """Color-code a package action by the first keyword it contains."""
+    lowered = action.lower()
+    color = next((c for keyword, c in _ACTION_COLOR.items() if keyword in lowered), None)
+    return f"[{color}]{action}[/{color}]" if color else action
+
+
 def cx_package_table(
     packages: list[tuple[str, str, str]],
     title: str = "Packages",
@@ -277,107 +460,99 @@ def cx_package_table(
     table.add_column("Action", style="green")
 
     for name, version, action in packages:
-        # Color-code actions
-        if "install" in action.lower():
-            action_styled = f"[green]{action}[/green]"
-        elif "remove" in action.lower() or "uninstall" in action.lower():
-            action_styled = f"[red]{action}[/red]"
-        elif "update" in action.lower() or "upgrade" in action.lower():
-            action_styled = f"[yellow]{action}[/yellow]"
-        else:
-            action_styled = action
-        table.add_row(name, version, action_styled)
+        table.add_row(name, version, _style_action(action))
 
+    cx_flush()
     console.print(table)
 
 
-def cx_divider(title: str | None = None) -> None:
+_DIVIDER_PLAIN = f"[{CORTEX_CYAN}]{'━' * 50}[/{CORTEX_CYAN}]"
+
+
+def cx_divider(title: str | None = None, write: bool = True) -> None:
     """
     Print a horizontal divider with optional title.
 
     Args:
         title: Optional section title
+        write: Print immediately (False buffers the line until cx_flush)
     """
-    if title:
-        console.print(f"\n[bold cyan]━━━ {title} ━━━[/bold cyan]\n")
-    else:
-        console.print(f"[{CORTEX_CYAN}]{'━' * 50}[/{CORTEX_CYAN}]")
+    _emit(titled_band(title) if title else _DIVIDER_PLAIN, write)
 
 
-def cx_success(message: str) -> None:
+def cx_success(message: str, write: bool = True) -> None:
     """Print a success message with checkmark."""
-    console.print(f"[{CORTEX_SUCCESS}]✓[/{CORTEX_SUCCESS}] {message}")
+    _emit(Text.assemble(ICON_SUCCESS, Text.from_markup(message)), write)
 
 
-def cx_error(message: str) -> None:
+def cx_error(message: str, write: bool = True) -> None:
     """Print an error message with X."""
-    console.print(f"[{CORTEX_ERROR}]✗[/{CORTEX_ERROR}] [{CORTEX_ERROR}]{message}[/{CORTEX_ERROR}]")
+    _emit(Text.assemble(ICON_ERROR, Text.from_markup(message, style=CORTEX_ERROR)), write)
 
 
-def cx_warning(message: str) -> None:
+def cx_warning(message: str, write: bool = True) -> None:
     """Print a warning message with warning icon."""
-    console.print(
-        f"[{CORTEX_WARNING}]⚠[/{CORTEX_WARNING}] [{CORTEX_WARNING}]{message}[/{CORTEX_WARNING}]"
-    )
+    _emit(Text.assemble(ICON_WARNING, Text.from_markup(message, style=CORTEX_WARNING)), write)
 
 
-def cx_info(message: str) -> None:
+def cx_info(message: str, write: bool = True) -> None:
     """Print an info message with info icon."""
-    console.print(f"[{CORTEX_INFO}]ℹ[/{CORTEX_INFO}] {message}")
+    _emit(Text.assemble(ICON_INFO, Text.from_markup(message)), write)
 
 
-def cx_spinner_message(message: str) -> None:
+def cx_spinner_message(message: str, write: bool = True) -> None:
     """Print a message with spinner icon (static, for logs)."""
-    console.print(f"[{CORTEX_CYAN}]⠋[/{CORTEX_CYAN}] {message}")
+    _emit(Text.assemble(_ICON_SPINNER, Text.from_markup(message)), write)
 
 
 # Demo
 if __name__ == "__main__":
-    # Full banner
-    show_banner()
-    print()
-
-    # Status box demo (Issue #242 format)
-    cx_status_box(
-        "CORTEX ML SCHEDULER",
-        [
-            ("Status", "Active", "success"),
-            ("Uptime", "0.5 seconds", "default"),
-            ("CPU Usage", "12%", "info"),
-            ("Memory", "256 MB", "warning"),
-        ],
-    )
-    print()
-
-    # Package table demo
-    cx_package_table(
-        [
-            ("docker.io", "24.0.5", "Install"),
-            ("docker-compose", "2.20.2", "Install"),
-            ("nginx", "1.24.0", "Update"),
-        ],
-        title="Installation Plan",
-    )
-    print()
-
-    # Simulated operation flow
-    cx_divider("Installation Progress")
-    cx_step(1, 4, "Updating package lists...")
-    cx_step(2, 4, "Installing docker.io...")
-    cx_step(3, 4, "Installing docker-compose...")
-    cx_step(4, 4, "Configuring services...")
-    print()
-
-    # Status messages
-    cx_success("Package installed successfully")
-    cx_warning("Disk space running low")
-    cx_error("Installation failed")
-    cx_info("Checking dependencies...")
-    print()
-
-    # Box demo
-    cx_box(
-        "Installation completed!\nAll packages are now available.",
-        title="Success",
-        status="success",
-    )
+    with single_write():
+        # Full banner
+        show_banner()
+        _emit()
+
+        # Status box demo (Issue #242 format)
+        cx_status_box(
+            "CORTEX ML SCHEDULER",
+            [
+                ("Status", "Active", "success"),
+                ("Uptime", "0.5 seconds", "default"),
+                ("CPU Usage", "12%", "info"),
+                ("Memory", "256 MB", "warning"),
+            ],
+        )
+        _emit()
+
+        # Package table demo
+        cx_package_table(
+            [
+                ("docker.io", "24.0.5", "Install"),
+                ("docker-compose", "2.20.2", "Install"),
+                ("nginx", "1.24.0", "Update"),
+            ],
+            title="Installation Plan",
+        )
+        _emit()
+
+        # Simulated operation flow
+        cx_divider("Installation Progress")
+        cx_step(1, 4, "Updating package lists...")
+        cx_step(2, 4, "Installing docker.io...")
+        cx_step(3, 4, "Installing docker-compose...")
+        cx_step(4, 4, "Configuring services...")
+        _emit()
+
+        # Status messages
+        cx_success("Package installed successfully")
+        cx_warning("Disk space running low")
+        cx_error("Installation failed")
+        cx_info("Checking dependencies...")
+        _emit()
+
+        # Box demo
+        cx_box(
+            "Installation completed!\nAll packages are now available.",
+            title="Success",
+            status="success",
+        )
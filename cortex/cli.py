@@ -1,4 +1,5 @@
 import argparse
+import io
 import logging
 import os
 import sys
@@ -3201,6 +3202,11 @@ def shell_suggest(text: str) -> int:
 
 
 def main():
+    # Emit stdout a line at a time even when piped (CI logs, `| tee`), so
+    # progress output appears as it is printed rather than in block-sized bursts.
+    if isinstance(sys.stdout, io.TextIOWrapper):
+        sys.stdout.reconfigure(line_buffering=True)
+
     # Load environment variables from .env files BEFORE accessing any API keys
     # This must happen before any code that reads os.environ for API keys
     from cortex.env_loader import load_env
@@ -11,15 +11,16 @@ from collections.abc import Generator
 from contextlib import contextmanager
 from dataclasses import dataclass
 from enum import Enum
+from functools import lru_cache
 
 from rich import box
-from rich.console import Console
 from rich.live import Live
 from rich.panel import Panel
 from rich.progress import (
     BarColumn,
     MofNCompleteColumn,
     Progress,
+    ProgressColumn,
     SpinnerColumn,
     TaskID,
     TaskProgressColumn,
@@ -29,9 +30,22 @@ from rich.progress import (
 )
 from rich.status import Status
 from rich.table import Table
+from rich.text import Text
 from rich.tree import Tree
 
-console = Console()
+from cortex.branding import (
+    ICON_ERROR,
+    ICON_INFO,
+    ICON_SUCCESS,
+    ICON_WARNING,
+    STYLED_ICONS,
+    console,
+    plain_box,
+    single_write,
+    status_row_templates,
+    titled_band,
+)
+from cortex.branding import STATUS_ICONS as STATUS_ICONS  # re-exported for callers
 
 # Color scheme matching Cortex branding
 COLORS = {
@@ -45,19 +59,13 @@ COLORS = {
     "highlight": "bold cyan",
 }
 
-# Status icons for consistent visual language
-STATUS_ICONS = {
-    "success": "✓",
-    "error": "✗",
-    "warning": "⚠",
-    "info": "ℹ",
-    "pending": "○",
-    "running": "●",
-    "skipped": "◌",
-    "active": "▶",
-    "installed": "📦",
-    "removed": "🗑️",
-    "updated": "🔄",
+# MultiStepProgress step status -> (icon markup, text style)
+_STATUS_RENDER = {
+    "pending": (STYLED_ICONS["pending"], "dim"),
+    "running": (STYLED_ICONS["running"], "cyan"),
+    "completed": (STYLED_ICONS["success"], "green"),
+    "failed": (STYLED_ICONS["error"], "red"),
+    "skipped": (STYLED_ICONS["skipped"], "dim"),
 }
 
 
@@ -72,7 +80,7 @@ class OutputStyle(Enum):
     MUTED = "muted"
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class TableColumn:
     """Configuration for a table column."""
 
@@ -83,7 +91,7 @@ class TableColumn:
     no_wrap: bool = False
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class StatusInfo:
     """Information for status display."""
 
@@ -92,6 +100,19 @@ class StatusInfo:
     style: OutputStyle = OutputStyle.DEFAULT
 
 
+# Row templates for format_status_box, keyed by style
+_STATUS_ROWS = status_row_templates(
+    {
+        OutputStyle.SUCCESS: "green",
+        OutputStyle.WARNING: "yellow",
+        OutputStyle.ERROR: "red",
+        OutputStyle.INFO: "cyan",
+        OutputStyle.MUTED: "dim",
+        OutputStyle.DEFAULT: "white",
+    }
+)
+
+
 def format_box(
     content: str,
     title: str | None = None,
@@ -139,6 +160,20 @@ def format_box(
     )
 
 
+def _status_box_content(items: list[StatusInfo]) -> str:
+    """Build the aligned label/value lines of a status box."""
+    max_label_len = max(len(item.label) for item in items) if items else 0
+    default_row = _STATUS_ROWS[OutputStyle.DEFAULT]
+    lines = [
+        _STATUS_ROWS.get(item.style, default_row).format(
+            item.label.ljust(max_label_len), item.value
+        )
+        for item in items
+    ]
+
+    return "\n".join(lines)
+
+
 def format_status_box(
     title: str,
     items: list[StatusInfo],
@@ -163,28 +198,8 @@ def format_status_box(
     Returns:
         Rich Panel object
     """
-    style_colors = {
-        OutputStyle.SUCCESS: "green",
-        OutputStyle.WARNING: "yellow",
-        OutputStyle.ERROR: "red",
-        OutputStyle.INFO: "cyan",
-        OutputStyle.MUTED: "dim",
-        OutputStyle.DEFAULT: "white",
-    }
-
-    # Build content with aligned labels
-    max_label_len = max(len(item.label) for item in items) if items else 0
-    lines = []
-
-    for item in items:
-        color = style_colors.get(item.style, "white")
-        padded_label = item.label.ljust(max_label_len)
-        lines.append(f"  [dim]{padded_label}:[/dim]  [{color}]{item.value}[/{color}]")
-
-    content = "\n".join(lines)
-
     return Panel(
-        content,
+        _status_box_content(items),
         title=f"[bold cyan]{title}[/bold cyan]",
         border_style=border_style,
         padding=(1, 2),
@@ -285,18 +300,25 @@ def format_dependency_tree(
         guide_style="dim",
     )
 
-    def add_deps(parent_tree: Tree, pkg: str, visited: set):
-        if pkg in visited:
-            parent_tree.add(f"[dim]{pkg} (circular)[/dim]")
-            return
-        visited.add(pkg)
-
-        deps = dependencies.get(pkg, [])
+    # Iterative DFS; `path` holds the packages on the current branch so a
+    # dependency is only marked circular when it repeats one of its ancestors.
+    path = {package}
+    stack = [(tree, package, iter(dependencies.get(package, [])))]
+    while stack:
+        parent_tree, pkg, deps = stack[-1]
+        # Resume this package's iterator; break to descend into a new dependency
         for dep in deps:
             branch = parent_tree.add(f"[cyan]{dep}[/cyan]")
-            add_deps(branch, dep, visited.copy())
+            if dep in path:
+                branch.add(f"[dim]{dep} (circular)[/dim]")
+                continue
+            path.add(dep)
+            stack.append((branch, dep, iter(dependencies.get(dep, []))))
+            break
+        else:
+            stack.pop()
+            path.discard(pkg)
 
-    add_deps(tree, package, set())
     return tree
 
 
@@ -328,13 +350,30 @@ def spinner_context(
         try:
             yield status
             if success_message:
-                console.print(f"[green]{STATUS_ICONS['success']}[/green] {success_message}")
+                console.print(f"{STYLED_ICONS['success']} {success_message}")
         except Exception:
             if error_message:
-                console.print(f"[red]{STATUS_ICONS['error']}[/red] {error_message}")
+                console.print(f"{STYLED_ICONS['error']} {error_message}")
             raise
 
 
+def _base_progress_columns() -> tuple[ProgressColumn, ...]:
+    """
+    Build the standard ProgressTracker columns.
+
+    Columns hold per-Progress state (e.g. spinner frames), so each tracker
+    gets fresh instances.
+    """
+    return (
+        SpinnerColumn(),
+        TextColumn("[bold cyan]{task.description}[/bold cyan]"),
+        BarColumn(bar_width=40, style="cyan", complete_style="green"),
+        TaskProgressColumn(),
+        MofNCompleteColumn(),
+        TimeElapsedColumn(),
+    )
+
+
 class ProgressTracker:
     """
     Progress bar tracker for multi-step operations.
@@ -347,6 +386,8 @@ class ProgressTracker:
                 tracker.advance()
     """
 
+    __slots__ = ("description", "total", "show_speed", "_progress", "_task_id")
+
     def __init__(
         self,
         description: str,
@@ -360,15 +401,7 @@ class ProgressTracker:
         self._task_id: TaskID | None = None
 
     def __enter__(self) -> "ProgressTracker":
-        columns = [
-            SpinnerColumn(),
-            TextColumn("[bold cyan]{task.description}[/bold cyan]"),
-            BarColumn(bar_width=40, style="cyan", complete_style="green"),
-            TaskProgressColumn(),
-            MofNCompleteColumn(),
-            TimeElapsedColumn(),
-        ]
-
+        columns = list(_base_progress_columns())
         if self.total is not None:
             columns.append(TimeRemainingColumn())
 
@@ -404,6 +437,29 @@ class ProgressTracker:
             self._progress.update(self._task_id, total=total)
 
 
+@lru_cache(maxsize=128)
+def _build_step_panel(steps: tuple[str, ...], statuses: tuple[str, ...], title: str) -> Panel:
+    """
+    Build the MultiStepProgress panel for a given step state.
+
+    Cached on the (steps, statuses, title) key so identical frames reuse
+    the same Panel instead of rebuilding it.
+    """
+    # Unknown statuses render like "skipped"
+    skipped = _STATUS_RENDER["skipped"]
+    renders = (_STATUS_RENDER.get(status, skipped) for status in statuses)
+    lines = [f"  {icon} [{style}]{step}[/{style}]" for step, (icon, style) in zip(steps, renders)]
+
+    content = "\n".join(lines)
+    return Panel(
+        content,
+        title=f"[bold cyan]{title}[/bold cyan]",
+        border_style="cyan",
+        padding=(1, 2),
+        box=box.ROUNDED,
+    )
+
+
 class MultiStepProgress:
     """
     Multi-step progress display for complex operations.
@@ -417,13 +473,17 @@ class MultiStepProgress:
                 progress.complete_step(step)
     """
 
+    __slots__ = ("steps", "title", "step_status", "_live", "_last_render_key")
+
     def __init__(self, steps: list[str], title: str = "Operation Progress"):
         self.steps = steps
         self.title = title
         self.step_status: dict = dict.fromkeys(steps, "pending")
         self._live: Live | None = None
+        self._last_render_key: tuple | None = None
 
     def __enter__(self) -> "MultiStepProgress":
+        self._last_render_key = self._render_key()
         self._live = Live(self._render(), console=console, refresh_per_second=10)
         self._live.start()
         return self
@@ -436,92 +496,80 @@ class MultiStepProgress:
 
     def _render(self) -> Panel:
         """Render the current step status."""
-        lines = []
-        for step in self.steps:
-            status = self.step_status[step]
-            if status == "pending":
-                icon = f"[dim]{STATUS_ICONS['pending']}[/dim]"
-                style = "dim"
-            elif status == "running":
-                icon = f"[cyan]{STATUS_ICONS['running']}[/cyan]"
-                style = "cyan"
-            elif status == "completed":
-                icon = f"[green]{STATUS_ICONS['success']}[/green]"
-                style = "green"
-            elif status == "failed":
-                icon = f"[red]{STATUS_ICONS['error']}[/red]"
-                style = "red"
-            else:
-                icon = f"[dim]{STATUS_ICONS['skipped']}[/dim]"
-                style = "dim"
-
-            lines.append(f"  {icon} [{style}]{step}[/{style}]")
-
-        content = "\n".join(lines)
-        return Panel(
-            content,
-            title=f"[bold cyan]{self.title}[/bold cyan]",
-            border_style="cyan",
-            padding=(1, 2),
-            box=box.ROUNDED,
-        )
+        return _build_step_panel(tuple(self.steps), self._render_key(), self.title)
+
+    def _render_key(self) -> tuple:
+        """Return a key identifying the currently displayed step state."""
+        return tuple(self.step_status[step] for step in self.steps)
+
+    def _refresh(self):
+        """Push a new frame to the live display if the step state changed."""
+        if not self._live:
+            return
+        key = self._render_key()
+        if key == self._last_render_key:
+            return
+        self._last_render_key = key
+        self._live.update(self._render())
 
     def start_step(self, step: str):
         """Mark a step as running."""
         if step in self.step_status:
             self.step_status[step] = "running"
-            if self._live:
-                self._live.update(self._render())
+            self._refresh()
 
     def complete_step(self, step: str):
         """Mark a step as completed."""
         if step in self.step_status:
             self.step_status[step] = "completed"
-            if self._live:
-                self._live.update(self._render())
+            self._refresh()
 
     def fail_step(self, step: str):
         """Mark a step as failed."""
         if step in self.step_status:
             self.step_status[step] = "failed"
-            if self._live:
-                self._live.update(self._render())
+            self._refresh()
 
     def skip_step(self, step: str):
         """Mark a step as skipped."""
         if step in self.step_status:
             self.step_status[step] = "skipped"
-            if self._live:
-                self._live.update(self._render())
+            self._refresh()
 
 
 def print_success(message: str):
     """Print a success message with icon."""
-    console.print(f"[green]{STATUS_ICONS['success']}[/green] {message}")
+    console.print(Text.assemble(ICON_SUCCESS, Text.from_markup(message)))
 
 
 def print_error(message: str):
     """Print an error message with icon."""
-    console.print(f"[red]{STATUS_ICONS['error']}[/red] [red]{message}[/red]")
+    console.print(Text.assemble(ICON_ERROR, Text.from_markup(message, style="red")))
 
 
 def print_warning(message: str):
     """Print a warning message with icon."""
-    console.print(f"[yellow]{STATUS_ICONS['warning']}[/yellow] [yellow]{message}[/yellow]")
+    console.print(Text.assemble(ICON_WARNING, Text.from_markup(message, style="yellow")))
 
 
 def print_info(message: str):
     """Print an info message with icon."""
-    console.print(f"[blue]{STATUS_ICONS['info']}[/blue] {message}")
+    console.print(Text.assemble(ICON_INFO, Text.from_markup(message)))
 
 
 def print_box(content: str, **kwargs):
-    """Print content in a formatted box."""
+    """Print content in a formatted box (plain text when not on a terminal)."""
+    if not console.is_terminal:
+        console.print(plain_box(content, kwargs.get("title"), kwargs.get("subtitle")))
+        return
     console.print(format_box(content, **kwargs))
 
 
 def print_status_box(title: str, items: list[StatusInfo], **kwargs):
-    """Print a status box with key-value pairs."""
+    """Print a status box with key-value pairs (plain text when not on a terminal)."""
+    if not console.is_terminal:
+        console.print(plain_box(_status_box_content(items), title))
+        return
     console.print(format_status_box(title, items, **kwargs))
 
 
@@ -533,84 +581,92 @@ def print_table(columns: list[TableColumn], rows: list[list[str]], **kwargs):
 def print_divider(title: str | None = None, style: str = "cyan"):
     """Print a horizontal divider with optional title."""
     if title:
-        console.print(f"\n[bold {style}]━━━ {title} ━━━[/bold {style}]\n")
+        console.print(titled_band(title, style))
     else:
         console.print(f"[{style}]{'━' * 50}[/{style}]")
 
 
+_BYTE_UNITS = ("B", "KB", "MB", "GB", "TB", "PB")
+
+
+@lru_cache(maxsize=1024)
 def format_bytes(num_bytes: int) -> str:
     """Format bytes to human-readable string."""
-    for unit in ["B", "KB", "MB", "GB", "TB"]:
-        if abs(num_bytes) < 1024.0:
-            return f"{num_bytes:.1f} {unit}"
-        num_bytes /= 1024.0
-    return f"{num_bytes:.1f} PB"
+    # Each unit is a factor of 2**10, so the bit length picks the unit directly
+    idx = min((int(abs(num_bytes)).bit_length() - 1) // 10, len(_BYTE_UNITS) - 1)
+    if idx <= 0:
+        return f"{num_bytes:.1f} B"
+    return f"{num_bytes / (1 << (idx * 10)):.1f} {_BYTE_UNITS[idx]}"
 
 
 def format_duration(seconds: float) -> str:
     """Format seconds to human-readable duration."""
     if seconds < 60:
         return f"{seconds:.1f}s"
-    elif seconds < 3600:
-        mins = int(seconds // 60)
-        secs = int(seconds % 60)
+    return _format_whole_duration(int(seconds))
+
+
+@lru_cache(maxsize=1024)
+def _format_whole_duration(seconds: int) -> str:
+    """Format a duration of a minute or more; only whole seconds are shown."""
+    mins, secs = divmod(seconds, 60)
+    if mins < 60:
         return f"{mins}m {secs}s"
-    else:
-        hours = int(seconds // 3600)
-        mins = int((seconds % 3600) // 60)
-        return f"{hours}h {mins}m"
+    hours, mins = divmod(mins, 60)
+    return f"{hours}h {mins}m"
 
 
 # Demo/test output
 if __name__ == "__main__":
-    # Demo the formatting capabilities
-    console.print("\n[bold cyan]Cortex Output Formatter Demo[/bold cyan]\n")
-
-    # Status box demo
-    print_status_box(
-        "CORTEX ML SCHEDULER",
-        [
-            StatusInfo("Status", "Active", OutputStyle.SUCCESS),
-            StatusInfo("Uptime", "0.5 seconds", OutputStyle.DEFAULT),
-            StatusInfo("CPU Usage", "12%", OutputStyle.INFO),
-            StatusInfo("Memory", "256 MB", OutputStyle.WARNING),
-        ],
-    )
+    with single_write():
+        # Demo the formatting capabilities
+        console.print("\n[bold cyan]Cortex Output Formatter Demo[/bold cyan]\n")
+
+        # Status box demo
+        print_status_box(
+            "CORTEX ML SCHEDULER",
+            [
+                StatusInfo("Status", "Active", OutputStyle.SUCCESS),
+                StatusInfo("Uptime", "0.5 seconds", OutputStyle.DEFAULT),
+                StatusInfo("CPU Usage", "12%", OutputStyle.INFO),
+                StatusInfo("Memory", "256 MB", OutputStyle.WARNING),
+            ],
+        )
 
-    console.print()
-
-    # Table demo
-    print_table(
-        columns=[
-            TableColumn("Package", style="cyan"),
-            TableColumn("Version", style="white"),
-            TableColumn("Status", style="green"),
-        ],
-        rows=[
-            ["docker.io", "24.0.5", "Installed"],
-            ["nginx", "1.24.0", "Available"],
-            ["python3", "3.11.2", "Installed"],
-        ],
-        title="System Packages",
-    )
+        console.print()
+
+        # Table demo
+        print_table(
+            columns=[
+                TableColumn("Package", style="cyan"),
+                TableColumn("Version", style="white"),
+                TableColumn("Status", style="green"),
+            ],
+            rows=[
+                ["docker.io", "24.0.5", "Installed"],
+                ["nginx", "1.24.0", "Available"],
+                ["python3", "3.11.2", "Installed"],
+            ],
+            title="System Packages",
+        )
 
-    console.print()
+        console.print()
 
-    # Box demo
-    print_box(
-        "Installation completed successfully!\nAll packages are now available.",
-        title="Success",
-        style=OutputStyle.SUCCESS,
-        border_style="green",
-    )
+        # Box demo
+        print_box(
+            "Installation completed successfully!\nAll packages are now available.",
+            title="Success",
+            style=OutputStyle.SUCCESS,
+            border_style="green",
+        )
 
-    console.print()
+        console.print()
 
-    # Divider demo
-    print_divider("Installation Plan")
+        # Divider demo
+        print_divider("Installation Plan")
 
-    # Status messages
-    print_success("Package installed successfully")
-    print_warning("Disk space running low")
-    print_error("Installation failed")
-    print_info("Checking dependencies...")
+        # Status messages
+        print_success("Package installed successfully")
+        print_warning("Disk space running low")
+        print_error("Installation failed")
+        print_info("Checking dependencies...")
@@ -9,23 +9,83 @@ Usage:
 
 import json
 import threading
+from collections.abc import Callable
+from functools import lru_cache
 from pathlib import Path
+from types import MappingProxyType
 from typing import Any
 
 from cortex.hardware_detection import has_nvidia_gpu
 
+try:
+    import orjson  # optional, faster JSON parsing (pip install cortex-linux[fast])
+
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+# orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers only
+# need to handle the stdlib exception.
+_json_loads = orjson.loads if HAS_ORJSON else json.loads
+
+
+@lru_cache(maxsize=1)
+def _has_gpu() -> bool:
+    """
+    Per-process cached has_nvidia_gpu() (it probes CPU, RAM and disk too).
+
+    Tests that swap has_nvidia_gpu should call _has_gpu.cache_clear().
+    """
+    return has_nvidia_gpu()
+
+
+def _freeze(value: Any) -> Any:
+    """Recursively convert parsed JSON into read-only mappings and tuples."""
+    if isinstance(value, dict):
+        return MappingProxyType({key: _freeze(item) for key, item in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+
+@lru_cache(maxsize=8)
+def _load_stacks_cached(path_str: str, mtime: float) -> dict[str, Any]:
+    """
+    Parse a stacks file, shared by every StackManager in the process.
+
+    Keyed on the file's mtime so an edited file is re-read. The result is
+    frozen (see _freeze) because it is shared between callers.
+
+    stacks.json is read directly rather than from a pickled sidecar: the
+    catalog is ~1 KB (json.loads takes a few microseconds), the package
+    directory may be read-only, and unpickling a file that sits outside
+    version control would be an avoidable code-execution risk.
+    """
+    stacks: dict[str, Any] = _freeze(_json_loads(Path(path_str).read_bytes()))
+    return stacks
+
 
 class StackManager:
     """Manages pre-built package stacks with hardware awareness"""
 
+    # Base stack id -> callable returning the hardware-appropriate variant
+    _VARIANT_RESOLVERS: dict[str, Callable[[], str]] = {
+        "ml": lambda: "ml" if _has_gpu() else "ml-cpu",
+    }
+
     def __init__(self) -> None:
         # stacks.json is in the same directory as this file (cortex/)
         self.stacks_file = Path(__file__).parent / "stacks.json"
-        self._stacks = None
+        # Loaded lazily by load_stacks() on first catalog access
+        self._stacks: dict[str, Any] | None = None
+        self._stack_index: dict[str, dict[str, Any]] = {}
+        self._by_tag: dict[str, list[int]] = {}  # tag -> catalog positions
+        self._by_hw: dict[str, list[int]] = {}  # hardware -> catalog positions
+        self._described: dict[str, str] = {}  # stack id -> describe_stack() text
         self._stacks_lock = threading.Lock()  # Protect _stacks cache
 
     def load_stacks(self) -> dict[str, Any]:
-        """Load stacks from JSON file (thread-safe)"""
+        """Load stacks from JSON file (thread-safe). The result is read-only."""
         # Fast path: check without lock
         if self._stacks is not None:
             return self._stacks
@@ -36,30 +96,72 @@ class StackManager:
                 return self._stacks
 
             try:
-                with open(self.stacks_file) as f:
-                    self._stacks = json.load(f)
-                return self._stacks
+                mtime = self.stacks_file.stat().st_mtime
+                stacks = _load_stacks_cached(str(self.stacks_file), mtime)
             except FileNotFoundError as e:
                 raise FileNotFoundError(f"Stacks config not found at {self.stacks_file}") from e
             except json.JSONDecodeError as e:
                 raise ValueError(f"Invalid JSON in {self.stacks_file}") from e
 
-    def list_stacks(self) -> list[dict[str, Any]]:
-        """Get all available stacks"""
-        stacks = self.load_stacks()
-        return stacks.get("stacks", [])
+            # id -> stack lookup (the first definition wins on duplicate ids),
+            # plus inverted indexes of catalog positions for filtered
+            # list_stacks(). Like the unfiltered listing, filters return
+            # every catalog entry once, duplicate ids included. Entries
+            # without an id are listed and filtered but not found by id.
+            index: dict[str, dict[str, Any]] = {}
+            by_tag: dict[str, list[int]] = {}
+            by_hw: dict[str, list[int]] = {}
+            for position, stack in enumerate(stacks.get("stacks", ())):
+                stack_id = stack.get("id")
+                if stack_id is not None:
+                    index.setdefault(stack_id, stack)
+                for tag in dict.fromkeys(stack.get("tags") or ()):
+                    by_tag.setdefault(tag, []).append(position)
+                by_hw.setdefault(stack.get("hardware", "any"), []).append(position)
+
+            # Publish _stacks last: the lock-free fast path above treats a
+            # non-None _stacks as "indexes are ready".
+            self._stack_index = index
+            self._by_tag = by_tag
+            self._by_hw = by_hw
+            self._described = {}
+            self._stacks = stacks
+            return self._stacks
+
+    def list_stacks(
+        self, tag: str | None = None, hardware: str | None = None
+    ) -> list[dict[str, Any]]:
+        """
+        Get available stacks (read-only mappings), optionally filtered.
+
+        Args:
+            tag: Only include stacks with this tag.
+            hardware: Only include stacks with this hardware requirement.
+
+        Returns:
+            Matching stacks in catalog order; all stacks when no filter is given.
+        """
+        catalog = self.load_stacks().get("stacks", ())
+        if tag is not None:
+            positions = self._by_tag.get(tag, [])
+            if hardware is not None:
+                hw_positions = set(self._by_hw.get(hardware, []))
+                positions = [pos for pos in positions if pos in hw_positions]
+        elif hardware is not None:
+            positions = self._by_hw.get(hardware, [])
+        else:
+            return list(catalog)
+        return [catalog[pos] for pos in positions]
 
     def find_stack(self, stack_id: str) -> dict[str, Any] | None:
-        """Find a stack by ID"""
-        for stack in self.list_stacks():
-            if stack["id"] == stack_id:
-                return stack
-        return None
-
-    def get_stack_packages(self, stack_id: str) -> list[str]:
-        """Get package list for a stack"""
+        """Find a stack by ID (read-only mapping)"""
+        self.load_stacks()
+        return self._stack_index.get(stack_id)
+
+    def get_stack_packages(self, stack_id: str) -> tuple[str, ...]:
+        """Get package list for a stack (read-only; empty if unknown)"""
         stack = self.find_stack(stack_id)
-        return stack.get("packages", []) if stack else []
+        return stack.get("packages", ()) if stack else ()
 
     def suggest_stack(self, base_stack: str) -> str:
         """
@@ -73,9 +175,10 @@ class StackManager:
         Returns:
         The suggested stack identifier (may differ from input).
         """
-        if base_stack == "ml":
-            return "ml" if has_nvidia_gpu() else "ml-cpu"
-        return base_stack
+        # Only hardware is consulted here; keep stacks.json out of this path
+        # so `cortex stack ml` variant selection does no catalog I/O.
+        resolver = self._VARIANT_RESOLVERS.get(base_stack)
+        return resolver() if resolver else base_stack
 
     def describe_stack(self, stack_id: str) -> str:
         """
@@ -89,22 +192,31 @@ class StackManager:
             packages, tags, and hardware requirements. Returns a not-found
             message if the stack doesn't exist.
         """
+        self.load_stacks()
+        cached = self._described.get(stack_id)
+        if cached is not None:
+            return cached
+
         stack = self.find_stack(stack_id)
         if not stack:
             return f"Stack '{stack_id}' not found"
 
-        output = f"\n📦 Stack: {stack['name']}\n"
-        output += f"Description: {stack['description']}\n\n"
-        output += "Packages included:\n"
-
-        for idx, pkg in enumerate(stack.get("packages", []), 1):
-            output += f"  {idx}. {pkg}\n"
+        parts = [
+            f"\n📦 Stack: {stack['name']}",
+            f"Description: {stack['description']}",
+            "",
+            "Packages included:",
+        ]
+        pkgs = stack.get("packages", ())
+        parts.extend(f"  {i + 1}. {pkgs[i]}" for i in range(len(pkgs)))
 
         tags = stack.get("tags", [])
         if tags:
-            output += f"\nTags:  {', '.join(tags)}\n"
+            parts.append(f"\nTags:  {', '.join(tags)}")
 
         hardware = stack.get("hardware", "any")
-        output += f"Hardware: {hardware}\n"
+        parts.append(f"Hardware: {hardware}")
 
-        return output
+        description = "\n".join(parts) + "\n"
+        self._described[stack_id] = description
+        return description
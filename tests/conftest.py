@@ -3,6 +3,8 @@ from __future__ import annotations
 import sys
 from pathlib import Path
 
+import pytest
+
 """Pytest configuration.
 
 Some tests in this repository import implementation modules as if they were top-level
@@ -22,3 +24,30 @@ for path in (repo_root / "src", repo_root / "cortex"):
     path_str = str(path)
     if path.exists() and path_str not in sys.path:
         sys.path.insert(0, path_str)
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _shared_console():
+    """Share one deterministic Rich console across every Cortex printing module.
+
+    Cortex modules print through a module-level ``console``, most of them the
+    one imported by name from ``cortex.branding``. Swap in a single uncolored,
+    fixed-width console for the whole session so captured output does not
+    depend on the terminal running the tests. It still writes to
+    ``sys.stdout``, so ``capsys`` keeps working.
+
+    Modules already imported (during collection) that bound the branding
+    console are found through ``sys.modules``; modules imported later pick up
+    the patched ``cortex.branding.console`` themselves.
+    """
+    from rich.console import Console
+
+    import cortex.branding as branding
+
+    original = branding.console
+    console = Console(force_terminal=False, no_color=True, width=120, highlight=False)
+    with pytest.MonkeyPatch.context() as mp:
+        for name, module in list(sys.modules.items()):
+            if name.startswith("cortex.") and getattr(module, "console", None) is original:
+                mp.setattr(module, "console", console)
+        yield console
@@ -4,22 +4,25 @@ Tests for Output Formatting Modules
 Issue: #242 - Output Polish: Rich Formatting with Colors, Boxes, Spinners
 """
 
-import io
-from unittest.mock import patch
+from dataclasses import FrozenInstanceError
 
 import pytest
 from rich.console import Console
 from rich.panel import Panel
 from rich.table import Table
 
+import cortex.branding as branding
+import cortex.output_formatter as output_formatter
 from cortex.branding import (
     CORTEX_CYAN,
     CORTEX_ERROR,
     CORTEX_SUCCESS,
     CORTEX_WARNING,
+    cx_batch,
     cx_box,
     cx_divider,
     cx_error,
+    cx_flush,
     cx_header,
     cx_info,
     cx_package_table,
@@ -30,6 +33,9 @@ from cortex.branding import (
     cx_table,
     cx_warning,
     show_banner,
+    show_goodbye,
+    show_welcome,
+    titled_band,
 )
 from cortex.output_formatter import (
     COLORS,
@@ -41,13 +47,16 @@ from cortex.output_formatter import (
     TableColumn,
     format_box,
     format_bytes,
+    format_dependency_tree,
     format_duration,
     format_package_table,
     format_status_box,
     format_table,
+    print_box,
     print_divider,
     print_error,
     print_info,
+    print_status_box,
     print_success,
     print_warning,
 )
@@ -80,43 +89,40 @@ class TestStatusIcons:
             assert icon in STATUS_ICONS
             assert len(STATUS_ICONS[icon]) >= 1
 
+    @pytest.mark.parametrize(
+        "icon,name",
+        [
+            (branding.ICON_SUCCESS, "success"),
+            (branding.ICON_ERROR, "error"),
+            (branding.ICON_WARNING, "warning"),
+            (branding.ICON_INFO, "info"),
+        ],
+    )
+    def test_text_icons_use_status_glyphs(self, icon, name):
+        """Verify the pre-parsed Text icons are built from STATUS_ICONS."""
+        assert icon.plain == f"{STATUS_ICONS[name]} "
+        assert branding.STATUS_ICONS is STATUS_ICONS
+
 
 class TestCxPrint:
     """Tests for cx_print function."""
 
-    def test_cx_print_info(self, capsys):
-        """Test info status output."""
-        cx_print("Test message", "info")
-        captured = capsys.readouterr()
-        assert "Test message" in captured.out
-        assert "CX" in captured.out
-
-    def test_cx_print_success(self, capsys):
-        """Test success status output."""
-        cx_print("Success message", "success")
+    @pytest.mark.parametrize(
+        "status,message,marker",
+        [
+            ("info", "Test message", "CX"),
+            ("success", "Success message", "✓"),
+            ("error", "Error message", "✗"),
+            ("warning", "Warning message", "⚠"),
+            ("thinking", "Thinking message", "CX"),
+        ],
+    )
+    def test_cx_print_status(self, capsys, status, message, marker):
+        """Test each status prints the message with its badge/icon."""
+        cx_print(message, status)
         captured = capsys.readouterr()
-        assert "Success message" in captured.out
-        assert "✓" in captured.out
-
-    def test_cx_print_error(self, capsys):
-        """Test error status output."""
-        cx_print("Error message", "error")
-        captured = capsys.readouterr()
-        assert "Error message" in captured.out
-        assert "✗" in captured.out
-
-    def test_cx_print_warning(self, capsys):
-        """Test warning status output."""
-        cx_print("Warning message", "warning")
-        captured = capsys.readouterr()
-        assert "Warning message" in captured.out
-        assert "⚠" in captured.out
-
-    def test_cx_print_thinking(self, capsys):
-        """Test thinking status output."""
-        cx_print("Thinking message", "thinking")
-        captured = capsys.readouterr()
-        assert "Thinking message" in captured.out
+        assert message in captured.out
+        assert marker in captured.out
 
 
 class TestCxStep:
@@ -139,6 +145,35 @@ class TestCxStep:
         assert "[3/3]" in captured.out
 
 
+class TestCxBatch:
+    """Tests for cx_batch/cx_flush output buffering."""
+
+    def test_batch_defers_output(self, capsys):
+        """Test output inside cx_batch is printed once on exit."""
+        with cx_batch():
+            cx_step(1, 2, "First step")
+            cx_success("Done")
+            assert capsys.readouterr().out == ""
+        captured = capsys.readouterr()
+        assert "[1/2]" in captured.out
+        assert "Done" in captured.out
+
+    def test_write_false_buffers_until_flush(self, capsys):
+        """Test write=False holds the line until cx_flush."""
+        cx_print("Buffered message", "info", write=False)
+        assert capsys.readouterr().out == ""
+        cx_flush()
+        assert "Buffered message" in capsys.readouterr().out
+
+    def test_buffered_line_printed_before_immediate_line(self, capsys):
+        """Test an immediate write flushes earlier write=False lines first."""
+        cx_print("first", write=False)
+        cx_print("second")
+        cx_flush()
+        out = capsys.readouterr().out
+        assert out.index("first") < out.index("second")
+
+
 class TestCxHeader:
     """Tests for cx_header function."""
 
@@ -172,6 +207,20 @@ class TestCxBox:
         captured = capsys.readouterr()
         assert "Success content" in captured.out
 
+    def test_cx_box_plain_when_not_terminal(self, capsys):
+        """Test box is printed without borders when stdout is not a terminal."""
+        cx_box("Content", title="Title", subtitle="Footer")
+        captured = capsys.readouterr()
+        assert captured.out == "=== Title ===\nContent\n--- Footer ---\n"
+
+    def test_cx_box_panel_on_terminal(self, capsys, monkeypatch):
+        """Test box keeps its borders on a terminal."""
+        monkeypatch.setattr(branding, "console", Console(force_terminal=True))
+        cx_box("Content", title="Title")
+        captured = capsys.readouterr()
+        assert "╭" in captured.out
+        assert "Title" in captured.out
+
 
 class TestCxStatusBox:
     """Tests for cx_status_box function."""
@@ -206,6 +255,22 @@ class TestCxStatusBox:
         assert "Short" in captured.out
         assert "LongerLabel" in captured.out
 
+    def test_status_box_plain_when_not_terminal(self, capsys):
+        """Test status box is printed without borders when stdout is not a terminal."""
+        cx_status_box("Status", [("Label", "Value", "success")])
+        captured = capsys.readouterr()
+        assert captured.out.startswith("=== Status ===\n")
+        assert "Value" in captured.out
+        assert "╭" not in captured.out
+
+    def test_status_box_panel_on_terminal(self, capsys, monkeypatch):
+        """Test status box keeps its borders on a terminal."""
+        monkeypatch.setattr(branding, "console", Console(force_terminal=True))
+        cx_status_box("Status", [("Label", "Value", "success")])
+        captured = capsys.readouterr()
+        assert "╭" in captured.out
+        assert "===" not in captured.out
+
 
 class TestCxTable:
     """Tests for cx_table function."""
@@ -265,6 +330,19 @@ class TestCxPackageTable:
         assert "pkg2" in captured.out
         assert "pkg3" in captured.out
 
+    @pytest.mark.parametrize(
+        "action,expected",
+        [
+            ("Uninstall", "[red]Uninstall[/red]"),
+            ("Install", "[green]Install[/green]"),
+            ("Upgrade", "[yellow]Upgrade[/yellow]"),
+            ("Keep", "Keep"),
+        ],
+    )
+    def test_style_action(self, action, expected):
+        """Test actions map to their color and unknown actions pass through."""
+        assert branding._style_action(action) == expected
+
 
 class TestCxDivider:
     """Tests for cx_divider function."""
@@ -282,37 +360,24 @@ class TestCxDivider:
         assert "Section" in captured.out
         assert "━" in captured.out
 
+    def test_band_markup(self):
+        """Test titled_band wraps the title in the requested color."""
+        assert titled_band("Section") == "\n[bold cyan]━━━ Section ━━━[/bold cyan]\n"
+        assert "[bold green]" in titled_band("Section", "green")
+
 
 class TestStatusMessages:
     """Tests for status message functions."""
 
-    def test_cx_success(self, capsys):
-        """Test success message."""
+    def test_status_messages(self, capsys):
+        """Test success/error/warning/info messages show their icons."""
         cx_success("Done")
-        captured = capsys.readouterr()
-        assert "✓" in captured.out
-        assert "Done" in captured.out
-
-    def test_cx_error(self, capsys):
-        """Test error message."""
         cx_error("Failed")
-        captured = capsys.readouterr()
-        assert "✗" in captured.out
-        assert "Failed" in captured.out
-
-    def test_cx_warning(self, capsys):
-        """Test warning message."""
         cx_warning("Caution")
-        captured = capsys.readouterr()
-        assert "⚠" in captured.out
-        assert "Caution" in captured.out
-
-    def test_cx_info(self, capsys):
-        """Test info message."""
         cx_info("Note")
-        captured = capsys.readouterr()
-        assert "ℹ" in captured.out
-        assert "Note" in captured.out
+        out = capsys.readouterr().out
+        for icon, message in [("✓", "Done"), ("✗", "Failed"), ("⚠", "Caution"), ("ℹ", "Note")]:
+            assert f"{icon} {message}" in out
 
 
 class TestOutputFormatterBox:
@@ -365,6 +430,26 @@ class TestOutputFormatterTable:
         assert col.width is None
 
 
+class TestDependencyTree:
+    """Tests for format_dependency_tree."""
+
+    def test_dependency_tree_marks_cycles(self):
+        """Test a dependency repeating an ancestor is marked circular."""
+        console = Console(record=True, width=80)
+        console.print(format_dependency_tree("a", {"a": ["b"], "b": ["a", "c"]}))
+        output = console.export_text()
+        assert "a (circular)" in output
+        assert "c" in output
+
+    def test_dependency_tree_shared_deps_not_circular(self):
+        """Test a dependency reached through two branches is not a cycle."""
+        console = Console(record=True, width=80)
+        console.print(format_dependency_tree("a", {"a": ["b", "c"], "b": ["d"], "c": ["d"]}))
+        output = console.export_text()
+        assert output.count("d") == 2
+        assert "circular" not in output
+
+
 class TestFormatHelpers:
     """Tests for format helper functions."""
 
@@ -390,6 +475,7 @@ class TestFormatHelpers:
         result = format_duration(90)
         assert "m" in result
         assert "1m 30s" == result
+        assert format_duration(90.9) == result  # fractional seconds are dropped
 
     def test_format_duration_hours(self):
         """Test format_duration with hours."""
@@ -412,6 +498,16 @@ class TestStatusInfo:
         info = StatusInfo("Label", "Value", OutputStyle.SUCCESS)
         assert info.style == OutputStyle.SUCCESS
 
+    def test_status_info_frozen_with_slots(self):
+        """Test StatusInfo and TableColumn are immutable, hashable slot classes."""
+        info = StatusInfo("Label", "Value")
+        col = TableColumn("Header")
+        for obj in (info, col):
+            assert not hasattr(obj, "__dict__")
+            hash(obj)
+        with pytest.raises(FrozenInstanceError):
+            info.value = "Changed"
+
 
 class TestOutputStyle:
     """Tests for OutputStyle enum."""
@@ -430,29 +526,51 @@ class TestOutputStyle:
 class TestPrintFunctions:
     """Tests for print helper functions."""
 
-    def test_print_success(self, capsys):
-        """Test print_success."""
-        print_success("Success")
+    @pytest.mark.parametrize(
+        "func,message,icon",
+        [
+            (print_success, "Success", "success"),
+            (print_error, "Error", "error"),
+            (print_warning, "Warning", "warning"),
+            (print_info, "Info", "info"),
+        ],
+    )
+    def test_print_status(self, capsys, func, message, icon):
+        """Test each print helper shows its status icon."""
+        func(message)
         captured = capsys.readouterr()
-        assert STATUS_ICONS["success"] in captured.out
+        assert STATUS_ICONS[icon] in captured.out
 
-    def test_print_error(self, capsys):
-        """Test print_error."""
-        print_error("Error")
+    def test_print_box_plain_when_not_terminal(self, capsys):
+        """Test print_box shares the plain layout of cx_box off a terminal."""
+        print_box("Content", title="Title", subtitle="Footer")
         captured = capsys.readouterr()
-        assert STATUS_ICONS["error"] in captured.out
+        assert captured.out == "=== Title ===\nContent\n--- Footer ---\n"
 
-    def test_print_warning(self, capsys):
-        """Test print_warning."""
-        print_warning("Warning")
+    def test_print_status_box_plain_when_not_terminal(self, capsys):
+        """Test print_status_box prints plain rows off a terminal."""
+        print_status_box("Status", [StatusInfo("Label", "Value")])
         captured = capsys.readouterr()
-        assert STATUS_ICONS["warning"] in captured.out
-
-    def test_print_info(self, capsys):
-        """Test print_info."""
-        print_info("Info")
+        assert captured.out.startswith("=== Status ===\n")
+        assert "Label:" in captured.out
+        assert "╭" not in captured.out
+
+    @pytest.mark.parametrize(
+        "printer",
+        [
+            lambda: print_box("Content", title="Title"),
+            lambda: print_status_box("Title", [StatusInfo("Label", "Value")]),
+        ],
+        ids=["print_box", "print_status_box"],
+    )
+    def test_boxes_panel_on_terminal(self, capsys, monkeypatch, printer):
+        """Test box printers keep their borders on a terminal."""
+        monkeypatch.setattr(output_formatter, "console", Console(force_terminal=True))
+        printer()
         captured = capsys.readouterr()
-        assert STATUS_ICONS["info"] in captured.out
+        assert "╭" in captured.out
+        assert "Title" in captured.out
+        assert "===" not in captured.out
 
     def test_print_divider(self, capsys):
         """Test print_divider."""
@@ -492,7 +610,7 @@ class TestMultiStepProgress:
         progress = MultiStepProgress(steps, "Test")
         assert progress.steps == steps
         assert progress.title == "Test"
-        assert all(status == "pending" for status in progress.step_status.values())
+        assert set(progress.step_status.values()) == {"pending"}
 
     def test_multi_step_start_step(self):
         """Test starting a step."""
@@ -522,6 +640,29 @@ class TestMultiStepProgress:
         progress.skip_step("Step 1")
         assert progress.step_status["Step 1"] == "skipped"
 
+    def test_multi_step_skips_unchanged_updates(self):
+        """Test the live display is only updated when step state changes."""
+
+        class LiveStub:
+            updates = 0
+
+            def update(self, renderable):
+                self.updates += 1
+
+        progress = MultiStepProgress(["Step 1", "Step 2"])
+        progress._live = LiveStub()
+        progress.complete_step("Step 1")
+        progress.complete_step("Step 1")
+        assert progress._live.updates == 1
+
+    def test_multi_step_render_reuses_panel(self):
+        """Test identical step state renders the same cached Panel."""
+        progress = MultiStepProgress(["Step 1", "Step 2"])
+        first = progress._render()
+        assert progress._render() is first
+        progress.start_step("Step 1")
+        assert progress._render() is not first
+
 
 class TestShowBanner:
     """Tests for show_banner function."""
@@ -537,3 +678,19 @@ class TestShowBanner:
         show_banner(show_version=True)
         captured = capsys.readouterr()
         assert "v" in captured.out or "0." in captured.out
+
+    def test_show_welcome_and_goodbye(self, capsys):
+        """Test captured welcome/goodbye output reaches stdout in order."""
+        show_welcome()
+        show_goodbye()
+        out = capsys.readouterr().out
+        assert out.index("Welcome to Cortex!") < out.index("Done!")
+        assert "cortex wizard" in out
+
+    def test_show_goodbye_inside_batch(self, capsys):
+        """Test goodbye output is written inside an outer cx_batch, after its earlier lines."""
+        with cx_batch():
+            cx_print("Batched first")
+            show_goodbye()
+            out = capsys.readouterr().out
+        assert out.index("Batched first") < out.index("Done!")
@@ -1,15 +1,200 @@
+import os
+import threading
+import time
+
 import pytest
 
 import cortex.stack_manager as stack_manager
 from cortex.stack_manager import StackManager
 
 
-def test_suggest_stack_ml_gpu_and_cpu(monkeypatch: pytest.MonkeyPatch) -> None:
+def _manager_for(tmp_path, payload: str) -> StackManager:
+    """Write ``payload`` as stacks.json and return a manager reading it."""
+    stacks_file = tmp_path / "stacks.json"
+    stacks_file.write_text(payload)
+    manager = StackManager()
+    manager.stacks_file = stacks_file
+    return manager
+
+
+@pytest.fixture(autouse=True)
+def _clear_gpu_cache():
+    """Keep the per-process GPU probe cache from leaking between tests."""
+    stack_manager._has_gpu.cache_clear()
+    yield
+    stack_manager._has_gpu.cache_clear()
+
+
+@pytest.mark.parametrize("has_gpu,expected", [(False, "ml-cpu"), (True, "ml")])
+def test_suggest_stack_ml_gpu_and_cpu(
+    monkeypatch: pytest.MonkeyPatch, has_gpu: bool, expected: str
+) -> None:
     """Test that 'ml' stack falls back to 'ml-cpu' when no GPU is detected."""
     manager = StackManager()
 
+    monkeypatch.setattr(stack_manager, "has_nvidia_gpu", lambda: has_gpu)
+    assert manager.suggest_stack("ml") == expected
+
+
+def test_suggest_stack_caches_gpu_probe(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test the GPU probe runs once per process, not once per suggestion."""
+    calls = []
+    monkeypatch.setattr(stack_manager, "has_nvidia_gpu", lambda: calls.append(1) or True)
+
+    manager = StackManager()
+    assert manager.suggest_stack("ml") == "ml"
+    assert StackManager().suggest_stack("ml") == "ml"
+    assert len(calls) == 1
+
+
+def test_find_stack_uses_first_definition(tmp_path) -> None:
+    """Test find_stack resolves ids from the index, preferring the first duplicate."""
+    manager = _manager_for(
+        tmp_path,
+        '{"stacks": [{"id": "a", "name": "First"}, {"id": "b", "name": "B"},'
+        ' {"id": "a", "name": "Second"}]}',
+    )
+
+    assert manager.find_stack("a")["name"] == "First"
+    assert manager.find_stack("b")["name"] == "B"
+    assert manager.find_stack("missing") is None
+
+
+def test_load_stacks_shared_across_instances(tmp_path) -> None:
+    """Test parsed stacks are reused by new managers until the file changes."""
+    first = _manager_for(tmp_path, '{"stacks": [{"id": "a", "name": "A"}]}')
+    second = StackManager()
+    second.stacks_file = first.stacks_file
+    assert first.load_stacks() is second.load_stacks()
+
+    third = _manager_for(tmp_path, '{"stacks": [{"id": "a", "name": "Edited"}]}')
+    stat = third.stacks_file.stat()
+    os.utime(third.stacks_file, (stat.st_atime, stat.st_mtime + 10))
+    assert third.find_stack("a")["name"] == "Edited"
+
+
+def test_suggest_stack_does_not_load_catalog(monkeypatch: pytest.MonkeyPatch, tmp_path) -> None:
+    """Test hardware-based suggestion never reads stacks.json."""
+    manager = StackManager()
+    manager.stacks_file = tmp_path / "missing.json"
     monkeypatch.setattr(stack_manager, "has_nvidia_gpu", lambda: False)
+
     assert manager.suggest_stack("ml") == "ml-cpu"
+    assert manager.suggest_stack("webdev") == "webdev"
+    assert manager._stacks is None
 
-    monkeypatch.setattr(stack_manager, "has_nvidia_gpu", lambda: True)
-    assert manager.suggest_stack("ml") == "ml"
+
+def test_describe_stack_format(tmp_path) -> None:
+    """Test describe_stack lists packages, tags and hardware."""
+    manager = _manager_for(
+        tmp_path,
+        '{"stacks": [{"id": "web", "name": "Web", "description": "Web tools",'
+        ' "packages": ["nginx", "nodejs"], "tags": ["http", "js"], "hardware": "any"}]}',
+    )
+
+    assert manager.describe_stack("web") == (
+        "\n📦 Stack: Web\n"
+        "Description: Web tools\n\n"
+        "Packages included:\n"
+        "  1. nginx\n"
+        "  2. nodejs\n"
+        "\nTags:  http, js\n"
+        "Hardware: any\n"
+    )
+    assert manager.describe_stack("missing") == "Stack 'missing' not found"
+    assert manager.describe_stack("web") is manager.describe_stack("web")
+
+
+def test_loaded_stacks_are_read_only() -> None:
+    """Test the shared stack cache cannot be mutated through returned objects."""
+    manager = StackManager()
+    stack = manager.list_stacks()[0]
+
+    with pytest.raises(TypeError):
+        stack["name"] = "changed"
+    assert isinstance(manager.get_stack_packages(stack["id"]), tuple)
+    assert manager.get_stack_packages("missing") == ()
+
+
+def test_load_stacks_invalid_json(tmp_path) -> None:
+    """Test malformed stacks.json is reported as ValueError with either parser."""
+    manager = _manager_for(tmp_path, '{"stacks": [')
+
+    with pytest.raises(ValueError, match="Invalid JSON"):
+        manager.load_stacks()
+
+
+def test_list_stacks_filters(tmp_path) -> None:
+    """Test list_stacks filters by tag and hardware, keeping duplicate ids like the full list."""
+    manager = _manager_for(
+        tmp_path,
+        '{"stacks": ['
+        '{"id": "ml", "tags": ["ai", "python"], "hardware": "gpu"},'
+        '{"id": "ml-cpu", "tags": ["ai"], "hardware": "cpu"},'
+        '{"id": "web", "tags": ["js"]},'
+        '{"id": "ml", "name": "Shadowed", "tags": ["ai"], "hardware": "gpu"}'
+        "]}",
+    )
+
+    def ids(**filters):
+        return [stack["id"] for stack in manager.list_stacks(**filters)]
+
+    # Filtered and unfiltered listings agree: duplicate ids are all listed
+    assert ids() == ["ml", "ml-cpu", "web", "ml"]
+    assert ids(tag="ai") == ["ml", "ml-cpu", "ml"]
+    assert ids(hardware="gpu") == ["ml", "ml"]
+    assert ids(hardware="any") == ["web"]
+    assert ids(tag="ai", hardware="cpu") == ["ml-cpu"]
+    assert ids(tag="missing") == []
+
+
+def test_load_stacks_single_flight(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test concurrent first calls parse the catalog only once."""
+    calls = []
+
+    def slow_load(path_str: str, mtime: float):
+        calls.append(path_str)
+        time.sleep(0.05)
+        return {"stacks": [{"id": "a"}]}
+
+    monkeypatch.setattr(stack_manager, "_load_stacks_cached", slow_load)
+    manager = StackManager()
+    results = []
+    threads = [
+        threading.Thread(target=lambda: results.append(manager.find_stack("a"))) for _ in range(8)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(calls) == 1
+    assert results == [{"id": "a"}] * 8
+
+
+def test_list_stacks_tolerates_missing_id(tmp_path) -> None:
+    """Test entries without an id are listed and filtered but not found by id."""
+    manager = _manager_for(
+        tmp_path,
+        '{"stacks": [{"name": "Nameless", "tags": ["ai"]}, {"id": "a", "tags": ["ai"]}]}',
+    )
+
+    def ids(**filters):
+        return [stack.get("id", "unknown") for stack in manager.list_stacks(**filters)]
+
+    assert ids() == ["unknown", "a"]
+    assert ids(tag="ai") == ["unknown", "a"]
+    assert ids(hardware="any") == ["unknown", "a"]
+    assert manager.find_stack("a")["id"] == "a"
+
+
+def test_list_stacks_irregular_tags(tmp_path) -> None:
+    """Test repeated tags list a stack once and null tags are treated as none."""
+    manager = _manager_for(
+        tmp_path,
+        '{"stacks": [{"id": "a", "tags": ["ai", "ai"]}, {"id": "b", "tags": null}]}',
+    )
+
+    assert [stack["id"] for stack in manager.list_stacks(tag="ai")] == ["a"]
+    assert [stack["id"] for stack in manager.list_stacks()] == ["a", "b"]
+    assert manager.find_stack("b")["id"] == "b"